@@ -9,7 +9,13 @@ setup(
         "typer",
         "rich",
         "pydantic",
+        "orjson",
     ],
+    extras_require={
+        "fast": [
+            "pyarrow",
+        ],
+    },
     python_requires=">=3.11",
     entry_points={
         "console_scripts": [
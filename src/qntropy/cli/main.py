@@ -1,16 +1,20 @@
 """Command-line interface for the Qntropy application."""
 
 import logging
+import os
 import sys
+import traceback
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 import typer
 from rich.console import Console
 from rich.logging import RichHandler
 
 from qntropy.importers.cointracking import CointrackingImporter
+from qntropy.models.transaction import Transaction
 from qntropy.utils.exceptions import CSVFormatException, DataValidationException
+from qntropy.utils.serializers import dumps
 
 app = typer.Typer(
     name="qntropy",
@@ -38,6 +42,46 @@ def setup_logging(verbose: bool) -> None:
     )
 
 
+def write_transactions_json(transactions: Iterable[Transaction], output_path: Path) -> int:
+    """
+    Write transactions to a JSON file as a list of objects.
+    
+    The file is written under a temporary name next to output_path and only
+    renamed to output_path once every transaction has been written, so an import
+    that fails part-way leaves any previous file at output_path untouched.
+    
+    The JSON is UTF-8 encoded, and amounts are strings with the digits of the
+    CSV file (e.g. "7500", where earlier versions wrote "7500.0").
+    
+    Args:
+        transactions: Transactions to write, e.g. as they are imported.
+        output_path: Path of the JSON file.
+        
+    Returns:
+        Number of transactions written.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    
+    # Each transaction is dumped as soon as it is imported and only counted afterwards,
+    # so memory use does not grow with the number of transactions
+    count = 0
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(b"[")
+            for transaction in transactions:
+                f.write(b",\n  " if count else b"\n  ")
+                f.write(dumps(transaction.model_dump(mode="json"), indent=True).replace(b"\n", b"\n  "))
+                count += 1
+            f.write(b"\n]" if count else b"]")
+        os.replace(temp_path, output_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    
+    return count
+
+
 @app.command()
 def import_cointracking(
     file_path: Path = typer.Argument(
@@ -60,21 +104,18 @@ def import_cointracking(
     
     try:
         importer = CointrackingImporter()
-        transactions = importer.import_file(file_path)
         
-        console.print(f"Successfully imported [green]{len(transactions)}[/green] transactions from {file_path}")
+        if output_path:
+            count = write_transactions_json(importer.iter_transactions(file_path), output_path)
+        else:
+            count = len(importer.import_file(file_path))
+        
+        console.print(f"Successfully imported [green]{count}[/green] transactions from {file_path}")
         
-        # If an output path is specified, save the transactions to a JSON file
         if output_path:
-            import json
-            from qntropy.utils.serializers import TransactionEncoder
-            
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w") as f:
-                json.dump([t.model_dump() for t in transactions], f, cls=TransactionEncoder, indent=2)
             console.print(f"Saved transactions to [green]{output_path}[/green]")
         
-        return transactions
+        return count
     
     except CSVFormatException as e:
         error_console.print(f"[bold red]CSV Format Error:[/bold red] {str(e)}")
@@ -85,7 +126,6 @@ def import_cointracking(
     except Exception as e:
         error_console.print(f"[bold red]Unexpected Error:[/bold red] {str(e)}")
         if verbose:
-            import traceback
             error_console.print(traceback.format_exc())
         sys.exit(1)
 
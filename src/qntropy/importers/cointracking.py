@@ -1,24 +1,284 @@
 """Importer for Cointracking.info CSV files."""
 
+from __future__ import annotations
+
 import csv
+import functools
 import logging
+import math
+import sys
 from datetime import datetime
-from decimal import Decimal, InvalidOperation
+from decimal import Decimal
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Pattern, Tuple, Set, cast
+
+from pydantic import TypeAdapter, ValidationError
 
-import pandas as pd
+try:
+    import _strptime
+except ImportError:  # pragma: no cover - CPython implementation detail
+    _strptime = None
 
 from qntropy.models.transaction import (
     Asset,
-    AssetAmount,
+    ImportResult,
     Transaction,
     TransactionType,
 )
 from qntropy.utils.exceptions import CSVFormatException, DataValidationException
 
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+# Validates a whole chunk of transaction records at once, which is cheaper than one model per call
+_TRANSACTION_LIST = TypeAdapter(List[Transaction])
+
+# Cell values read as missing: the pandas defaults, also passed to pyarrow so all readers agree
+_NA_VALUES = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+    "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+})
+
+
+# Row validation messages, in the order both import paths check them; an invalid row reports
+# the first check it fails. The fields in braces are filled in by _format_row_error.
+_ROW_CHECKS = (
+    # Basic requirements
+    "Transaction type is missing",
+    "Transaction must have at least one valid asset (buy or sell)",
+    # Consistency of the Cointracking type with the data
+    "Buy transaction must have valid buy amount and currency",
+    "Sell transaction must have valid sell amount and currency",
+    "Trade transaction must have both valid buy and sell data",
+    "{ct_type} transaction must have valid buy amount and currency",
+    "Withdrawal transaction must have valid sell amount and currency",
+    # Date
+    "{date_error}",
+    # Consistency of the mapped type with the created assets
+    "{transaction_type} transaction must have an incoming asset",
+    "{transaction_type} transaction must have an outgoing asset",
+    "Trade transaction must have both incoming and outgoing assets",
+)
+
+
+def _format_row_error(
+    message: str, ct_type: Optional[str], transaction_type: Optional[TransactionType], date_error: Optional[str]
+) -> str:
+    """
+    Fill in the row fields of a validation message from _ROW_CHECKS.
+    
+    Args:
+        message: Message of the failed check.
+        ct_type: Cointracking transaction type of the row.
+        transaction_type: Mapped transaction type of the row.
+        date_error: Date parsing error of the row.
+        
+    Returns:
+        The error message of the row.
+    """
+    if "{" not in message:
+        return message
+    return message.format(
+        ct_type=ct_type,
+        transaction_type=transaction_type.value if transaction_type is not None else None,
+        date_error=date_error,
+    )
+
+
+# Integer codes of the transaction types, for the array-based classification below
+_TYPE_CODES = {transaction_type: code for code, transaction_type in enumerate(TransactionType)}
+_UNKNOWN_TYPE_CODE = -1
+_BUY_CODE = _TYPE_CODES[TransactionType.BUY]
+_SELL_CODE = _TYPE_CODES[TransactionType.SELL]
+_TRADE_CODE = _TYPE_CODES[TransactionType.TRADE]
+
+
+def _classify_numpy(type_codes: np.ndarray, buy_positive: np.ndarray, sell_positive: np.ndarray) -> np.ndarray:
+    """
+    Resolve unknown transaction type codes from the amounts present.
+    
+    Unknown types become BUY or SELL if only one side has an amount, TRADE otherwise
+    (see CointrackingImporter._fallback_type).
+    
+    Args:
+        type_codes: Type codes of the rows, _UNKNOWN_TYPE_CODE for unknown types.
+        buy_positive: Boolean array flagging rows with a positive buy amount.
+        sell_positive: Boolean array flagging rows with a positive sell amount.
+        
+    Returns:
+        Type codes with the unknown types resolved.
+    """
+    import numpy as np
+    
+    fallback = np.where(
+        buy_positive & ~sell_positive, _BUY_CODE,
+        np.where(sell_positive & ~buy_positive, _SELL_CODE, _TRADE_CODE),
+    )
+    return np.where(type_codes == _UNKNOWN_TYPE_CODE, fallback, type_codes).astype(type_codes.dtype)
+
+
+# NumPy, pandas and pyarrow are only needed for the column-wise path used on larger
+# files. Functions of that path import them locally, after _load_dataframe_libraries
+# has checked they are installed, so small imports and CLI commands do not pay for
+# their startup.
+@functools.lru_cache(maxsize=None)
+def _load_dataframe_libraries() -> bool:
+    """
+    Import the libraries of the column-wise import path, once.
+    
+    Returns:
+        True if pandas and NumPy are available, False otherwise.
+    """
+    try:
+        import numpy  # noqa: F401
+        import pandas  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pyarrow() -> bool:
+    """
+    Import pyarrow, an optional speed-up of the column-wise import path, once.
+    
+    Returns:
+        True if pyarrow is available, False otherwise.
+    """
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.compute  # noqa: F401
+        import pyarrow.csv  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _types_by_code() -> np.ndarray:
+    """
+    Return the transaction types indexed by their integer codes.
+    
+    Returns:
+        Object array with the TransactionType of every code in _TYPE_CODES.
+    """
+    import numpy as np
+    
+    return np.array(list(TransactionType), dtype=object)
+
+
+# strptime directives the compiled date patterns know how to assemble into a datetime
+_DATE_FIELDS = ("Y", "m", "d", "H", "M", "S")
+
+
+@functools.lru_cache(maxsize=None)
+def _date_pattern(fmt: str) -> Optional[Pattern[str]]:
+    """
+    Compile a date format into the regex datetime.strptime would use for it.
+    
+    datetime.strptime looks the regex up again on every call; compiling it once
+    lets _match_date match and build the datetime directly.
+    
+    Args:
+        fmt: strptime date format.
+        
+    Returns:
+        The compiled pattern, or None if the format cannot be handled this way.
+    """
+    try:
+        pattern = _strptime._TimeRE_cache.compile(fmt)
+    except Exception:
+        # Internal API changed or is missing; callers fall back to strptime
+        return None
+    
+    if not set(pattern.groupindex) <= set(_DATE_FIELDS):
+        return None
+    return pattern
+
+
+# ISO 8601 formats, by the character separating the date from the time
+_ISO_DATE_FORMATS = {
+    "%Y-%m-%d %H:%M:%S": " ",
+    "%Y-%m-%dT%H:%M:%S": "T",
+}
+
+
+def _parse_iso_date(date_str: str, separator: str) -> Optional[datetime]:
+    """
+    Parse a date in the fixed-width "%Y-%m-%d %H:%M:%S" layout, with the given separator.
+    
+    Once the layout is checked, the string is a valid ISO 8601 date, so the C-level
+    datetime.fromisoformat can parse it about ten times faster than strptime.
+    
+    Args:
+        date_str: Date string to parse.
+        separator: Character between the date and the time (" " or "T").
+        
+    Returns:
+        Parsed datetime object, or None if the string is not a valid date in this exact layout.
+    """
+    if (
+        len(date_str) != 19
+        or date_str[4] != "-" or date_str[7] != "-" or date_str[10] != separator
+        or date_str[13] != ":" or date_str[16] != ":"
+        or not date_str.isascii()
+    ):
+        return None
+    
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        return None
+
+
+def _match_date(date_str: str, fmt: str) -> Optional[datetime]:
+    """
+    Parse a date string like datetime.strptime, using a precompiled pattern when possible.
+    
+    A string that does not match returns None rather than raising, so trying the
+    formats one after the other costs no exception per miss.
+    
+    Args:
+        date_str: Date string to parse.
+        fmt: strptime date format.
+        
+    Returns:
+        Parsed datetime object, or None if the date string does not match the format.
+    """
+    separator = _ISO_DATE_FORMATS.get(fmt)
+    if separator is not None:
+        parsed = _parse_iso_date(date_str, separator)
+        if parsed is not None:
+            return parsed
+    
+    pattern = _date_pattern(fmt)
+    if pattern is None:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            return None
+    
+    match = pattern.fullmatch(date_str)
+    if match is None:
+        return None
+    
+    fields = match.groupdict()
+    try:
+        return datetime(
+            int(fields["Y"]),
+            int(fields["m"]),
+            int(fields["d"]),
+            int(fields.get("H") or 0),
+            int(fields.get("M") or 0),
+            int(fields.get("S") or 0),
+        )
+    except ValueError:
+        # Out of range for the calendar, e.g. February 30th
+        return None
+
 
 class CointrackingImporter:
     """Importer for Cointracking.info CSV files."""
@@ -71,13 +331,34 @@ class CointrackingImporter:
     ]
 
     # Date formats supported by Cointracking.info
-    DATE_FORMATS = [
+    DATE_FORMATS = (
         "%Y-%m-%d %H:%M:%S",  # 2023-01-15 14:30:25
         "%d.%m.%Y %H:%M",     # 15.01.2023 14:30
         "%Y-%m-%dT%H:%M:%S",  # 2023-01-15T14:30:25
         "%d/%m/%Y %H:%M:%S",  # 15/01/2023 14:30:25
         "%d-%m-%Y %H:%M:%S",  # 15-01-2023 14:30:25
-    ]
+    )
+
+    # Number of rows parsed at a time when reading with pandas
+    CHUNK_SIZE = 50_000
+    
+    # Number of bytes parsed at a time when reading with pyarrow; exports take about
+    # 80 bytes per row, so a block holds roughly CHUNK_SIZE rows
+    ARROW_BLOCK_SIZE = 4 << 20
+    
+    # Files smaller than this (in bytes) are parsed row by row with the csv module,
+    # which beats the fixed per-column cost of pandas on small inputs
+    SMALL_FILE_SIZE = 1_000_000
+    
+    # Cointracking types that require a buy amount and currency
+    BUY_ONLY_TYPES = frozenset({"Deposit", "Staking", "Interest", "Airdrop", "Mining"})
+    
+    # Internal types that require an incoming or an outgoing asset
+    INCOMING_TYPES = frozenset({
+        TransactionType.BUY, TransactionType.DEPOSIT, TransactionType.STAKING_REWARD,
+        TransactionType.INTEREST, TransactionType.AIRDROP, TransactionType.MINING,
+    })
+    OUTGOING_TYPES = frozenset({TransactionType.SELL, TransactionType.WITHDRAWAL})
 
     def __init__(self, skip_invalid_rows: bool = False) -> None:
         """
@@ -87,8 +368,11 @@ class CointrackingImporter:
             skip_invalid_rows: If True, skip invalid rows instead of failing the entire import.
         """
         self.skip_invalid_rows = skip_invalid_rows
+        
+        # Date formats in trial order; the format detected for the current file goes first
+        self._date_formats: Tuple[str, ...] = self.DATE_FORMATS
 
-    def import_file(self, file_path: Path) -> List[Transaction]:
+    def import_file(self, file_path: Path) -> ImportResult:
         """
         Import transactions from a Cointracking.info CSV file.
         
@@ -96,7 +380,26 @@ class CointrackingImporter:
             file_path: Path to the CSV file.
             
         Returns:
-            List of Transaction objects.
+            List of Transaction objects, which can also be looked up by type.
+            
+        Raises:
+            CSVFormatException: If the CSV file is malformed or missing required columns.
+            DataValidationException: If the data in the CSV file is invalid and skip_invalid_rows is False.
+        """
+        return ImportResult(self.iter_transactions(file_path))
+
+    def iter_transactions(self, file_path: Path) -> Iterator[Transaction]:
+        """
+        Import transactions from a Cointracking.info CSV file, yielding them as they are parsed.
+        
+        The file is read in chunks of CHUNK_SIZE rows, so memory use does not grow with the
+        size of the file unless the caller keeps the transactions.
+        
+        Args:
+            file_path: Path to the CSV file.
+            
+        Yields:
+            Transaction objects, in file order.
             
         Raises:
             CSVFormatException: If the CSV file is malformed or missing required columns.
@@ -108,365 +411,813 @@ class CointrackingImporter:
             raise CSVFormatException(f"File not found: {file_path}")
             
         try:
-            # Use pandas to read the CSV file
-            df = pd.read_csv(file_path)
-            
-            # Rename columns based on the mapping
-            df_columns = list(df.columns)
-            for csv_col, expected_col in self.COLUMN_MAPPING.items():
-                if csv_col in df_columns and expected_col not in df_columns:
-                    df = df.rename(columns={csv_col: expected_col})
-            
-            # Check if required columns exist in the DataFrame
-            missing_columns = [col for col in self.REQUIRED_COLUMNS if col not in df.columns]
-            if missing_columns:
-                raise CSVFormatException(
-                    f"Missing required columns in CSV: {', '.join(missing_columns)}"
-                )
-            
-            # Convert DataFrame rows to Transaction objects
-            transactions = []
+            transaction_count = 0
             invalid_rows = []
             
-            for idx, row in df.iterrows():
-                # Parse row
-                line_number = idx + 2  # +2 because idx is 0-based and there's a header row
-                try:
-                    # Apply additional data cleaning
-                    row = self._clean_row_data(row)
-                    
-                    # Validate row has the minimal required data
-                    self._validate_row_basic_requirements(row)
-                    
-                    transaction = self._parse_row(row, file_path.name, line_number)
-                    transactions.append(transaction)
-                except Exception as e:
-                    # Record error information
-                    error_msg = f"Error in row {line_number}: {str(e)}"
-                    invalid_rows.append((line_number, error_msg))
-                    
-                    if not self.skip_invalid_rows:
-                        if isinstance(e, DataValidationException):
-                            raise DataValidationException(error_msg) from e
-                        else:
-                            raise DataValidationException(f"Unexpected error processing row {line_number}: {str(e)}") from e
-                    else:
-                        # Log the error but continue processing
-                        logger.warning(error_msg)
+            for transactions, chunk_invalid_rows in self._parse_chunks(file_path):
+                invalid_rows.extend(chunk_invalid_rows)
+                transaction_count += len(transactions)
+                
+                yield from transactions
             
             # Report on the import results
             if invalid_rows:
                 logger.warning(f"Skipped {len(invalid_rows)} invalid rows during import")
-                for line, error in invalid_rows:
-                    logger.debug(f"  Line {line}: {error}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    for line, error in invalid_rows:
+                        logger.debug(f"  Line {line}: {error}")
             
-            logger.info(f"Successfully imported {len(transactions)} transactions from {file_path}")
+            logger.info(f"Successfully imported {transaction_count} transactions from {file_path}")
             
-            if len(transactions) == 0 and len(invalid_rows) > 0:
+            if transaction_count == 0 and len(invalid_rows) > 0:
                 logger.error("No valid transactions were found in the file")
                 raise DataValidationException(f"No valid transactions found in {file_path}. All {len(invalid_rows)} rows had validation errors.")
-                
-            return transactions
             
-        except pd.errors.EmptyDataError:
-            raise CSVFormatException(f"The CSV file {file_path} is empty")
-        except pd.errors.ParserError:
-            raise CSVFormatException(f"Error parsing CSV file {file_path}")
+        except (CSVFormatException, DataValidationException):
+            # Re-raise the exception without modifying it
+            raise
         except Exception as e:
-            if isinstance(e, (CSVFormatException, DataValidationException)):
-                # Re-raise the exception without modifying it
-                raise
+            # pandas errors can only come from the column-wise path, which has imported pandas
+            pandas = sys.modules.get("pandas")
+            if pandas is not None and isinstance(e, pandas.errors.EmptyDataError):
+                raise CSVFormatException(f"The CSV file {file_path} is empty")
+            elif pandas is not None and isinstance(e, pandas.errors.ParserError):
+                raise CSVFormatException(f"Error parsing CSV file {file_path}")
             else:
                 # Convert other exceptions to CSVFormatException
                 raise CSVFormatException(f"Unexpected error reading CSV file {file_path}: {str(e)}")
     
-    def _clean_row_data(self, row: pd.Series) -> pd.Series:
+    def _parse_chunks(self, file_path: Path) -> Iterator[Tuple[List[Transaction], List[Tuple[int, str]]]]:
         """
-        Clean and normalize row data before parsing.
+        Parse a CSV file chunk by chunk.
+        
+        Files smaller than SMALL_FILE_SIZE, or any file when pandas is not installed,
+        are parsed in a single pass with the csv module.
         
         Args:
-            row: Pandas Series representing a row from the CSV.
+            file_path: Path to the CSV file.
             
-        Returns:
-            Cleaned row data.
+        Yields:
+            Tuples with the transactions and the invalid rows of each chunk, as returned by _parse_frame.
+            
+        Raises:
+            CSVFormatException: If the CSV file is malformed or missing required columns.
+            DataValidationException: If a row is invalid and skip_invalid_rows is False.
         """
-        # Create a copy to avoid modifying the original DataFrame
-        cleaned_row = row.copy()
+        file_size = file_path.stat().st_size
+        if file_size < self.SMALL_FILE_SIZE or not _load_dataframe_libraries():
+            yield self._import_with_stdlib(file_path)
+            return
         
-        # Strip whitespace from string columns
-        for col in cleaned_row.index:
-            if isinstance(cleaned_row[col], str):
-                cleaned_row[col] = cleaned_row[col].strip()
+        for df, first_line in self._numbered_chunks(file_path):
+            yield self._parse_frame(df, file_path.name, first_line)
+
+    def _numbered_chunks(self, file_path: Path) -> Iterator[Tuple[pd.DataFrame, int]]:
+        """
+        Read a CSV file in chunks, tracking the file line number of each chunk.
         
-        return cleaned_row
-    
-    def _validate_row_basic_requirements(self, row: pd.Series) -> None:
+        The date format of the file is detected from the first chunk, before it is yielded.
+        
+        Args:
+            file_path: Path to the CSV file.
+            
+        Yields:
+            Tuples with a chunk and the line number of its first row in the file.
+        """
+        first_line = 2  # Line number of the first data row, after the header row
+        
+        for chunk_index, df in enumerate(self._read_csv_chunks(file_path)):
+            if chunk_index == 0:
+                # A file almost always uses a single date format, so detect it once up front
+                self._detect_date_format(df["Date"])
+            
+            yield df, first_line
+            first_line += len(df)
+
+    def _read_columns(self, file_path: Path) -> List[str]:
         """
-        Validate that a row meets basic requirements before detailed parsing.
+        Read the header of a CSV file and resolve the column names.
         
         Args:
-            row: Pandas Series representing a row from the CSV.
+            file_path: Path to the CSV file.
+            
+        Returns:
+            Column names, with the Cointracking names mapped to our expected names.
             
         Raises:
-            DataValidationException: If the row doesn't meet basic requirements.
+            CSVFormatException: If the CSV file is empty or missing required columns.
         """
-        # Check that the row has a valid type
-        if pd.isna(row["Type"]) or not row["Type"]:
-            raise DataValidationException("Transaction type is missing")
+        with open(file_path, newline="", encoding="utf-8-sig") as f:
+            header = next(csv.reader(f), None)
+        if not header:
+            raise CSVFormatException(f"The CSV file {file_path} is empty")
         
-        # Check that the row has at least one valid asset (buy or sell)
-        has_buy = pd.notna(row["Buy Amount"]) and pd.notna(row["Buy Currency"]) and self._is_positive_number(row["Buy Amount"])
-        has_sell = pd.notna(row["Sell Amount"]) and pd.notna(row["Sell Currency"]) and self._is_positive_number(row["Sell Amount"])
+        # Name repeated columns the way pandas does ("Cur.", "Cur..1", ...) so COLUMN_MAPPING applies
+        seen: Dict[str, int] = {}
+        columns = []
+        for name in header:
+            count = seen.get(name, 0)
+            seen[name] = count + 1
+            columns.append(f"{name}.{count}" if count else name)
         
-        if not (has_buy or has_sell):
-            raise DataValidationException("Transaction must have at least one valid asset (buy or sell)")
-            
-        # Check transaction type consistency with data
-        self._validate_transaction_type_consistency(row)
+        # Rename columns based on the mapping
+        original_columns = set(columns)
+        rename_map = {
+            csv_col: expected_col
+            for csv_col, expected_col in self.COLUMN_MAPPING.items()
+            if csv_col in original_columns and expected_col not in original_columns
+        }
+        if rename_map:
+            columns = [rename_map.get(col, col) for col in columns]
+        
+        # Check if required columns exist in the file
+        column_set = set(columns)
+        missing_columns = [col for col in self.REQUIRED_COLUMNS if col not in column_set]
+        if missing_columns:
+            raise CSVFormatException(
+                f"Missing required columns in CSV: {', '.join(missing_columns)}"
+            )
+        
+        return columns
 
-    def _is_positive_number(self, value) -> bool:
+    def _read_csv_chunks(self, file_path: Path) -> Iterator[pd.DataFrame]:
         """
-        Check if a value represents a positive number.
+        Read a CSV file as a sequence of DataFrames of stripped strings.
+        
+        Every cell is read as a string so amounts keep their exact decimal representation.
+        Only the required columns are kept, and whitespace is stripped from all of them
+        column by column. The multi-threaded pyarrow reader is used when pyarrow is
+        installed, with pandas as the fallback.
         
         Args:
-            value: Value to check.
+            file_path: Path to the CSV file.
             
-        Returns:
-            True if the value is a positive number, False otherwise.
+        Yields:
+            DataFrames of at most CHUNK_SIZE rows (pandas) or ARROW_BLOCK_SIZE bytes (pyarrow),
+            with the required columns and None/NaN for empty cells.
+            
+        Raises:
+            CSVFormatException: If the CSV file is empty, malformed or missing required columns.
         """
+        columns = self._read_columns(file_path)
+        
+        if not _load_pyarrow():
+            yield from self._read_csv_chunks_with_pandas(file_path, columns)
+            return
+        
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.csv as pacsv
+        
+        # pyarrow cannot pad a row with fewer fields than the header, as pandas and the csv
+        # module path do, so such a row stops the pyarrow reader and pandas reads the rest
+        short_rows = []
+        
+        def handle_invalid_row(row: Any) -> str:
+            if row.actual_columns < row.expected_columns:
+                short_rows.append(row.number)
+            return "error"
+        
+        rows_read = 0
         try:
-            # Replace comma with dot for decimal separator if it's a string
-            if isinstance(value, str):
-                value = value.replace(',', '.')
-            
-            num_value = float(value)
-            return num_value > 0
-        except (ValueError, TypeError):
-            return False
-    
-    def _validate_transaction_type_consistency(self, row: pd.Series) -> None:
+            # Memory-map the file, so Arrow tokenizes it in place without copying it into Python
+            with pa.memory_map(str(file_path)) as source:
+                reader = pacsv.open_csv(
+                    source,
+                    read_options=pacsv.ReadOptions(
+                        column_names=columns,
+                        skip_rows=1,
+                        block_size=self.ARROW_BLOCK_SIZE,
+                        use_threads=True,
+                    ),
+                    # Comments can hold quoted line breaks, which may fall across a block boundary
+                    parse_options=pacsv.ParseOptions(
+                        newlines_in_values=True, invalid_row_handler=handle_invalid_row
+                    ),
+                    convert_options=pacsv.ConvertOptions(
+                        column_types={name: pa.string() for name in columns},
+                        null_values=sorted(_NA_VALUES),
+                        strings_can_be_null=True,
+                        include_columns=self.REQUIRED_COLUMNS,
+                    ),
+                )
+                for batch in reader:
+                    # Strip in Arrow, before the values are turned into Python strings
+                    stripped = [pc.utf8_trim_whitespace(column) for column in batch.columns]
+                    rows_read += batch.num_rows
+                    yield pa.RecordBatch.from_arrays(stripped, names=batch.schema.names).to_pandas()
+        except pa.ArrowInvalid as e:
+            if not short_rows:
+                raise CSVFormatException(f"Error parsing CSV file {file_path}: {str(e)}") from e
+        else:
+            return
+        
+        yield from self._read_csv_chunks_with_pandas(file_path, columns, skip_records=rows_read)
+
+    def _read_csv_chunks_with_pandas(
+        self, file_path: Path, columns: List[str], skip_records: int = 0
+    ) -> Iterator[pd.DataFrame]:
         """
-        Validate that the transaction type is consistent with the data in the row.
+        Read a CSV file with pandas, as a sequence of DataFrames of stripped strings.
         
         Args:
-            row: Pandas Series representing a row from the CSV.
+            file_path: Path to the CSV file.
+            columns: Column names of the file, as resolved by _read_columns.
+            skip_records: Number of records to drop from the start, because another reader
+                already returned them. Records are counted after parsing, so blank lines and
+                quoted line breaks do not shift the count, as they would with skiprows.
             
-        Raises:
-            DataValidationException: If the transaction type is inconsistent with the data.
+        Yields:
+            DataFrames of at most CHUNK_SIZE rows, with the required columns and NaN for empty cells.
         """
-        ct_type = row["Type"]
-        has_buy = pd.notna(row["Buy Amount"]) and pd.notna(row["Buy Currency"]) and self._is_positive_number(row["Buy Amount"])
-        has_sell = pd.notna(row["Sell Amount"]) and pd.notna(row["Sell Currency"]) and self._is_positive_number(row["Sell Amount"])
+        import pandas as pd
         
-        # Type-specific validations
-        if ct_type == "Buy" and not has_buy:
-            raise DataValidationException("Buy transaction must have valid buy amount and currency")
-        elif ct_type == "Sell" and not has_sell:
-            raise DataValidationException("Sell transaction must have valid sell amount and currency")
-        elif ct_type == "Trade" and not (has_buy and has_sell):
-            raise DataValidationException("Trade transaction must have both valid buy and sell data")
-        elif ct_type in ["Deposit", "Staking", "Interest", "Airdrop", "Mining"] and not has_buy:
-            raise DataValidationException(f"{ct_type} transaction must have valid buy amount and currency")
-        elif ct_type == "Withdrawal" and not has_sell:
-            raise DataValidationException("Withdrawal transaction must have valid sell amount and currency")
+        with pd.read_csv(
+            file_path, dtype=str, header=0, names=columns, usecols=self.REQUIRED_COLUMNS,
+            chunksize=self.CHUNK_SIZE,
+        ) as reader:
+            for chunk in reader:
+                if skip_records >= len(chunk):
+                    skip_records -= len(chunk)
+                    continue
+                if skip_records:
+                    chunk = chunk.iloc[skip_records:]
+                    skip_records = 0
+                yield chunk.apply(lambda column: column.str.strip())
 
-    def _parse_row(self, row: pd.Series, source_file: str, line_number: int) -> Transaction:
+    def _parse_frame(
+        self, df: pd.DataFrame, source_file: str, first_line: int = 2
+    ) -> Tuple[List[Transaction], List[Tuple[int, str]]]:
         """
-        Parse a row from the CSV file into a Transaction object.
+        Convert a DataFrame of Cointracking rows into Transaction objects.
+        
+        Cleaning, validation, type mapping and date parsing are done column-wise;
+        only the final Transaction construction iterates over the rows.
         
         Args:
-            row: Pandas Series representing a row from the CSV.
+            df: DataFrame with the required columns, holding stripped strings.
             source_file: Name of the source file.
-            line_number: Line number in the source file.
+            first_line: Line number of the first row of the DataFrame in the source file.
             
         Returns:
-            Transaction object.
+            Tuple with the list of Transaction objects and the list of
+            (line number, error message) tuples for the rows that were skipped.
             
         Raises:
-            DataValidationException: If the data in the row is invalid.
+            DataValidationException: If a row is invalid and skip_invalid_rows is False.
         """
-        try:
-            # Parse date
-            date_str = row["Date"]
-            timestamp = self._parse_date(date_str)
-
-            # Determine transaction type
-            ct_type = row["Type"]
-            transaction_type = self._determine_transaction_type(ct_type, row)
-
-            # Parse buy (incoming) asset
-            asset_in = None
-            if pd.notna(row["Buy Amount"]) and pd.notna(row["Buy Currency"]) and self._is_positive_number(row["Buy Amount"]):
-                buy_amount = self._parse_decimal(row["Buy Amount"], "Buy Amount")
-                buy_currency = row["Buy Currency"].strip()
-                asset_in = AssetAmount(
-                    asset=Asset(symbol=buy_currency),
-                    amount=buy_amount
-                )
-
-            # Parse sell (outgoing) asset
-            asset_out = None
-            if pd.notna(row["Sell Amount"]) and pd.notna(row["Sell Currency"]) and self._is_positive_number(row["Sell Amount"]):
-                sell_amount = self._parse_decimal(row["Sell Amount"], "Sell Amount")
-                sell_currency = row["Sell Currency"].strip()
-                asset_out = AssetAmount(
-                    asset=Asset(symbol=sell_currency),
-                    amount=sell_amount
-                )
-
-            # Parse fee
-            fee = None
-            if pd.notna(row["Fee"]) and pd.notna(row["Fee Currency"]) and self._is_positive_number(row["Fee"]):
-                fee_amount = self._parse_decimal(row["Fee"], "Fee")
-                fee_currency = row["Fee Currency"].strip()
-                fee = AssetAmount(
-                    asset=Asset(symbol=fee_currency),
-                    amount=fee_amount
-                )
-
-            # Create the transaction
-            transaction = Transaction(
+        import numpy as np
+        import pandas as pd
+        
+        columns = {col: df[col] for col in self.REQUIRED_COLUMNS}
+        
+        ct_types = columns["Type"]
+        type_missing = (ct_types.isna() | (ct_types == "")).to_numpy()
+        
+        buy_amounts, buy_positive = self._parse_decimal_column(columns["Buy Amount"])
+        sell_amounts, sell_positive = self._parse_decimal_column(columns["Sell Amount"])
+        fee_amounts, fee_positive = self._parse_decimal_column(columns["Fee"])
+        
+        has_buy = buy_positive & columns["Buy Currency"].notna().to_numpy()
+        has_sell = sell_positive & columns["Sell Currency"].notna().to_numpy()
+        has_fee = fee_positive & columns["Fee Currency"].notna().to_numpy()
+        
+        transaction_types = self._map_transaction_types(ct_types, type_missing, buy_positive, sell_positive)
+        timestamps, date_errors = self._parse_date_column(columns["Date"])
+        
+        errors = self._row_errors(
+            ct_types, type_missing, transaction_types, has_buy, has_sell, date_errors
+        )
+        
+        # Report the invalid rows first, in file order, so only valid rows remain for the loop below
+        valid = pd.isna(errors)
+        invalid_rows: List[Tuple[int, str]] = []
+        for line_number, error in zip((np.flatnonzero(~valid) + first_line).tolist(), errors[~valid].tolist()):
+            self._reject_row(line_number, error, invalid_rows)
+        
+        def valid_values(values: np.ndarray) -> List:
+            return values[valid].tolist()
+        
+        def valid_strings(values: pd.Series) -> List[Optional[str]]:
+            return self._column_values(values[valid])
+        
+        # Build the records of the valid rows in one comprehension over plain Python lists:
+        # walking NumPy arrays would box every flag and value into a NumPy scalar on each row
+        records = [
+            dict(
                 timestamp=timestamp,
                 transaction_type=transaction_type,
-                asset_in=asset_in,
-                asset_out=asset_out,
-                fee=fee,
-                exchange=row["Exchange"] if pd.notna(row["Exchange"]) else None,
-                trade_group=row["Group"] if pd.notna(row["Group"]) else None,
-                notes=row["Comment"] if pd.notna(row["Comment"]) else None,
+                asset_in=dict(asset=Asset.get(buy_currency), amount=buy_amount) if row_has_buy else None,
+                asset_out=dict(asset=Asset.get(sell_currency), amount=sell_amount) if row_has_sell else None,
+                fee=dict(asset=Asset.get(fee_currency), amount=fee_amount) if row_has_fee else None,
+                exchange=exchange,
+                trade_group=trade_group,
+                notes=notes,
                 source_file=source_file,
                 source_line=line_number
             )
+            for (
+                line_number, timestamp, transaction_type,
+                row_has_buy, buy_amount, buy_currency,
+                row_has_sell, sell_amount, sell_currency,
+                row_has_fee, fee_amount, fee_currency,
+                exchange, trade_group, notes,
+            ) in zip(
+                (np.flatnonzero(valid) + first_line).tolist(),
+                valid_values(timestamps), valid_values(transaction_types.to_numpy()),
+                valid_values(has_buy), valid_values(buy_amounts), valid_strings(columns["Buy Currency"]),
+                valid_values(has_sell), valid_values(sell_amounts), valid_strings(columns["Sell Currency"]),
+                valid_values(has_fee), valid_values(fee_amounts), valid_strings(columns["Fee Currency"]),
+                valid_strings(columns["Exchange"]),
+                valid_strings(columns["Group"]),
+                valid_strings(columns["Comment"]),
+            )
+        ]
+        
+        return self._build_transactions(records), invalid_rows
+
+    def _import_with_stdlib(self, file_path: Path) -> Tuple[List[Transaction], List[Tuple[int, str]]]:
+        """
+        Parse a whole CSV file row by row with the csv module.
+        
+        Produces the same transactions and errors as the pandas path, without its
+        per-column overhead, which dominates on small files.
+        
+        Args:
+            file_path: Path to the CSV file.
             
-            # Final validation of the transaction
-            self._validate_created_transaction(transaction)
+        Returns:
+            Tuple with the list of Transaction objects and the list of
+            (line number, error message) tuples for the rows that were skipped.
             
-            return transaction
+        Raises:
+            CSVFormatException: If the CSV file is malformed or missing required columns.
+            DataValidationException: If a row is invalid and skip_invalid_rows is False.
+        """
+        columns = self._read_columns(file_path)
+        positions = [columns.index(col) for col in self.REQUIRED_COLUMNS]
+        
+        with open(file_path, newline="", encoding="utf-8-sig") as f:
+            reader = csv.reader(f)
+            next(reader)  # Header, already resolved by _read_columns
+            rows: List[List[Optional[str]]] = []
+            for row in reader:
+                if not row:
+                    continue  # Blank line
+                if len(row) > len(columns):
+                    raise CSVFormatException(
+                        f"Error parsing CSV file {file_path}: Expected {len(columns)} fields "
+                        f"in line {reader.line_num}, saw {len(row)}"
+                    )
+                
+                # Short rows are padded with missing values, like pandas does
+                row += [""] * (len(columns) - len(row))
+                values: List[Optional[str]] = [
+                    None if cell in _NA_VALUES else cell.strip() for cell in map(row.__getitem__, positions)
+                ]
+                
+                # Every row of a type shares one string, so the type lookups and
+                # comparisons in _parse_row_list mostly succeed on identity
+                ct_type = values[0]
+                if ct_type:
+                    values[0] = sys.intern(ct_type)
+                rows.append(values)
+        
+        date_position = self.REQUIRED_COLUMNS.index("Date")
+        self._detect_date_format(values[date_position] for values in rows)
+        
+        records: List[Dict[str, Any]] = []
+        invalid_rows: List[Tuple[int, str]] = []
+        unknown_types: Set[str] = set()
+        for line_number, values in enumerate(rows, start=2):
+            record, error = self._parse_row_list(values, file_path.name, line_number, unknown_types)
+            if error is not None:
+                self._reject_row(line_number, error, invalid_rows)
+            elif record is not None:
+                records.append(record)
+        
+        return self._build_transactions(records), invalid_rows
 
-        except DataValidationException:
-            # Re-raise validation exceptions without modification
-            raise
-        except Exception as e:
-            # Convert other exceptions to DataValidationException
-            raise DataValidationException(f"Error parsing row: {str(e)}")
+    def _parse_row_list(
+        self, row: List[Optional[str]], source_file: str, line_number: int, unknown_types: Set[str]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Validate one row and convert it into a transaction record.
+        
+        Applies the checks of _ROW_CHECKS, like _row_errors does for a whole chunk.
+        
+        Args:
+            row: Stripped values of the required columns, in REQUIRED_COLUMNS order (None if missing).
+            source_file: Name of the source file.
+            line_number: Line number of the row in the source file.
+            unknown_types: Unknown Cointracking types already reported; updated in place.
             
-    def _determine_transaction_type(self, ct_type: str, row: pd.Series) -> TransactionType:
+        Returns:
+            Tuple with the transaction record (None if invalid) and the error message (None if valid).
+        """
+        (
+            ct_type, buy_value, buy_currency, sell_value, sell_currency,
+            fee_value, fee_currency, exchange, trade_group, notes, date_value,
+        ) = row
+        
+        buy_amount = self._parse_amount(buy_value)
+        sell_amount = self._parse_amount(sell_value)
+        fee_amount = self._parse_amount(fee_value)
+        has_buy = buy_amount is not None and buy_currency is not None
+        has_sell = sell_amount is not None and sell_currency is not None
+        has_fee = fee_amount is not None and fee_currency is not None
+        
+        # Date; a missing date gets the message pandas' NaN would produce
+        timestamp: Optional[datetime]
+        date_error: Optional[str]
+        if date_value is None:
+            timestamp, date_error = None, "Invalid date string: nan"
+        else:
+            timestamp, date_error = self._try_parse_date(date_value)
+        
+        transaction_type = self.TRANSACTION_TYPE_MAPPING.get(ct_type) if ct_type else None
+        if ct_type and transaction_type is None:
+            transaction_type = self._fallback_type(buy_amount is not None, sell_amount is not None)
+            if ct_type not in unknown_types:
+                unknown_types.add(ct_type)
+                logger.warning(f"Unknown transaction type: {ct_type}, defaulting by buy/sell amounts")
+        
+        # The checks of _ROW_CHECKS, in the same order
+        failed = (
+            not ct_type,
+            not (has_buy or has_sell),
+            ct_type == "Buy" and not has_buy,
+            ct_type == "Sell" and not has_sell,
+            ct_type == "Trade" and not (has_buy and has_sell),
+            ct_type in self.BUY_ONLY_TYPES and not has_buy,
+            ct_type == "Withdrawal" and not has_sell,
+            date_error is not None,
+            transaction_type in self.INCOMING_TYPES and not has_buy,
+            transaction_type in self.OUTGOING_TYPES and not has_sell,
+            transaction_type == TransactionType.TRADE and not (has_buy and has_sell),
+        )
+        if True in failed:
+            message = _ROW_CHECKS[failed.index(True)]
+            return None, _format_row_error(message, ct_type, transaction_type, date_error)
+        
+        return dict(
+            timestamp=timestamp,
+            transaction_type=transaction_type,
+            asset_in=dict(asset=Asset.get(buy_currency), amount=buy_amount) if has_buy else None,
+            asset_out=dict(asset=Asset.get(sell_currency), amount=sell_amount) if has_sell else None,
+            fee=dict(asset=Asset.get(fee_currency), amount=fee_amount) if has_fee else None,
+            exchange=exchange,
+            trade_group=trade_group,
+            notes=notes,
+            source_file=source_file,
+            source_line=line_number
+        ), None
+
+    @staticmethod
+    def _parse_amount(value: Optional[str]) -> Optional[Decimal]:
         """
-        Determine the transaction type based on the Cointracking type and row data.
+        Parse a stripped amount cell, accepting the same values as _parse_decimal_column.
         
         Args:
-            ct_type: Cointracking transaction type.
-            row: Row data.
+            value: Stripped amount string, or None if the cell is empty.
             
         Returns:
-            Determined TransactionType.
+            The amount as a Decimal if it is a positive number, None otherwise.
         """
-        # Direct mapping if available
-        if ct_type in self.TRANSACTION_TYPE_MAPPING:
-            return self.TRANSACTION_TYPE_MAPPING[ct_type]
+        if not value:
+            return None
         
-        # Fallback logic for unknown types
-        has_buy = pd.notna(row["Buy Amount"]) and self._is_positive_number(row["Buy Amount"])
-        has_sell = pd.notna(row["Sell Amount"]) and self._is_positive_number(row["Sell Amount"])
+        # Replace comma with dot for decimal separator
+        cleaned = value.replace(",", ".")
+        
+        # float() also takes underscores and non-ASCII digits, which pd.to_numeric rejects
+        if "_" in cleaned or not cleaned.isascii():
+            return None
+        try:
+            number = float(cleaned)
+        except ValueError:
+            return None
         
-        if has_buy and has_sell:
-            logger.warning(f"Unknown transaction type: {ct_type}, defaulting to TRADE")
-            return TransactionType.TRADE
-        elif has_buy:
-            logger.warning(f"Unknown transaction type: {ct_type}, defaulting to BUY")
+        # Rejects NaN, infinity, zero and negative amounts
+        if not 0 < number < math.inf:
+            return None
+        return Decimal(cleaned)
+
+    @staticmethod
+    def _fallback_type(buy_positive: bool, sell_positive: bool) -> TransactionType:
+        """
+        Pick the transaction type for an unknown Cointracking type from the amounts present.
+        
+        Args:
+            buy_positive: Whether the row has a positive buy amount.
+            sell_positive: Whether the row has a positive sell amount.
+            
+        Returns:
+            BUY or SELL if only one side has an amount, TRADE otherwise.
+        """
+        if buy_positive and not sell_positive:
             return TransactionType.BUY
-        elif has_sell:
-            logger.warning(f"Unknown transaction type: {ct_type}, defaulting to SELL")
+        if sell_positive and not buy_positive:
             return TransactionType.SELL
-        else:
-            # This shouldn't happen due to prior validation, but just in case
-            logger.warning(f"Unknown transaction type with no clear assets: {ct_type}, defaulting to TRADE")
-            return TransactionType.TRADE
+        return TransactionType.TRADE
 
-    def _validate_created_transaction(self, transaction: Transaction) -> None:
+    def _reject_row(self, line_number: int, error: str, invalid_rows: List[Tuple[int, str]]) -> None:
         """
-        Validate that a created transaction is logically consistent.
+        Record an invalid row, or fail the import if invalid rows are not skipped.
         
         Args:
-            transaction: Transaction to validate.
+            line_number: Line number of the row in the source file.
+            error: Validation error of the row.
+            invalid_rows: List of (line number, error message) tuples; updated in place.
             
         Raises:
-            DataValidationException: If the transaction is not valid.
+            DataValidationException: If skip_invalid_rows is False.
+        """
+        # Record error information; skipped rows are reported together at the end of the import
+        error_msg = f"Error in row {line_number}: {error}"
+        invalid_rows.append((line_number, error_msg))
+        
+        if not self.skip_invalid_rows:
+            raise DataValidationException(error_msg)
+
+    @staticmethod
+    def _build_transactions(records: List[Dict[str, Any]]) -> List[Transaction]:
         """
-        # Validate that the transaction has the right assets for its type
-        if transaction.transaction_type in [TransactionType.BUY, TransactionType.DEPOSIT, TransactionType.STAKING_REWARD,
-                                          TransactionType.INTEREST, TransactionType.AIRDROP, TransactionType.MINING] and not transaction.asset_in:
-            raise DataValidationException(f"{transaction.transaction_type.value} transaction must have an incoming asset")
+        Build Transaction objects from validated records in a single validation call.
+        
+        Args:
+            records: Keyword arguments of the transactions to build.
             
-        if transaction.transaction_type in [TransactionType.SELL, TransactionType.WITHDRAWAL] and not transaction.asset_out:
-            raise DataValidationException(f"{transaction.transaction_type.value} transaction must have an outgoing asset")
+        Returns:
+            List of Transaction objects.
             
-        if transaction.transaction_type == TransactionType.TRADE and (not transaction.asset_in or not transaction.asset_out):
-            raise DataValidationException("Trade transaction must have both incoming and outgoing assets")
+        Raises:
+            DataValidationException: If a record fails model validation.
+        """
+        try:
+            return _TRANSACTION_LIST.validate_python(records)
+        except ValidationError as e:
+            # The first item of the error location is the index of the record in the list
+            line_number = records[cast(int, e.errors()[0]["loc"][0])]["source_line"]
+            raise DataValidationException(f"Error in row {line_number}: Error parsing row: {str(e)}") from e
 
-    def _parse_date(self, date_str: str) -> datetime:
+    def _parse_decimal_column(self, values: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Parse a date string into a datetime object.
+        Parse an amount column into Decimals.
+        
+        Validation runs column-wise with pd.to_numeric; Decimals are then built from the
+        cleaned strings of the valid rows only, so they keep the exact precision of the file.
         
         Args:
-            date_str: Date string to parse.
+            values: Stripped string values of the amount column.
             
         Returns:
-            Parsed datetime object.
+            Tuple with an object array holding a Decimal for every positive amount
+            (None elsewhere) and a boolean array flagging the positive amounts.
+        """
+        import numpy as np
+        import pandas as pd
+        
+        # Replace comma with dot for decimal separator
+        cleaned = values.fillna("").str.replace(",", ".", regex=False)
+        
+        # Invalid numbers become NaN, which fails the positive check like negatives and zeros;
+        # infinities are rejected too, as AssetAmount only accepts finite amounts
+        numeric = pd.to_numeric(cleaned, errors="coerce").to_numpy(dtype=float)
+        positive = (numeric > 0) & np.isfinite(numeric)
+        
+        # Build one Decimal per distinct amount string: Decimals are immutable, and
+        # exports repeat the same amounts (fees, round deposits) many times
+        codes, uniques = pd.factorize(cleaned.to_numpy()[positive])
+        decimals = np.empty(len(uniques), dtype=object)
+        decimals[:] = [Decimal(value) for value in uniques]
+        
+        amounts = np.full(len(values), None, dtype=object)
+        amounts[positive] = decimals[codes]
+        return amounts, positive
+
+    def _map_transaction_types(
+        self,
+        ct_types: pd.Series,
+        type_missing: np.ndarray,
+        buy_positive: np.ndarray,
+        sell_positive: np.ndarray,
+    ) -> pd.Series:
+        """
+        Map Cointracking transaction types to our internal types.
+        
+        Unknown types fall back to TRADE, BUY or SELL depending on which amounts are present.
+        
+        Args:
+            ct_types: Stripped Cointracking transaction types.
+            type_missing: Boolean array flagging rows without a transaction type.
+            buy_positive: Boolean array flagging rows with a positive buy amount.
+            sell_positive: Boolean array flagging rows with a positive sell amount.
             
-        Raises:
-            DataValidationException: If the date string cannot be parsed.
+        Returns:
+            Series of TransactionType values (None for rows without a transaction type).
         """
-        if not date_str or not isinstance(date_str, str):
-            raise DataValidationException(f"Invalid date string: {date_str}")
+        import numpy as np
+        import pandas as pd
         
-        # Strip whitespace
-        date_str = date_str.strip()
+        # Exports use a handful of distinct types, so look up each one once and
+        # spread the codes over the rows; missing types get code -1, the extra slot
+        codes, uniques = pd.factorize(ct_types)
+        code_table = np.array(
+            [
+                _TYPE_CODES[self.TRANSACTION_TYPE_MAPPING[ct_type]]
+                if ct_type in self.TRANSACTION_TYPE_MAPPING else _UNKNOWN_TYPE_CODE
+                for ct_type in uniques
+            ]
+            + [_UNKNOWN_TYPE_CODE],
+            dtype=np.int8,
+        )
+        type_codes = code_table[codes]
         
-        format_errors = []
+        # Log each unknown type once rather than once per row
+        for ct_type, code in zip(uniques, code_table):
+            if code == _UNKNOWN_TYPE_CODE:
+                logger.warning(f"Unknown transaction type: {ct_type}, defaulting by buy/sell amounts")
+        
+        transaction_types = _types_by_code()[_classify_numpy(type_codes, buy_positive, sell_positive)]
+        transaction_types[type_missing] = None
+        return pd.Series(transaction_types, index=ct_types.index)
+
+    def _parse_date_column(self, values: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Parse a date column into datetime objects.
+        
+        Each distinct date string is parsed only once.
+        
+        Args:
+            values: Stripped date strings.
+            
+        Returns:
+            Tuple with an object array of datetimes (None where parsing failed)
+            and an object array of error messages (None where parsing succeeded).
+        """
+        import numpy as np
+        import pandas as pd
+        
+        codes, uniques = pd.factorize(values)
+        
+        # Missing values get code -1, which picks the extra slot at the end
+        unique_values = list(uniques) + [np.nan]
+        parsed = np.full(len(unique_values), None, dtype=object)
+        errors = np.full(len(unique_values), None, dtype=object)
+        for code, value in enumerate(unique_values):
+            parsed[code], errors[code] = self._try_parse_date(value)
+        
+        return parsed[codes], errors[codes]
+
+    def _row_errors(
+        self,
+        ct_types: pd.Series,
+        type_missing: np.ndarray,
+        transaction_types: pd.Series,
+        has_buy: np.ndarray,
+        has_sell: np.ndarray,
+        date_errors: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Validate all rows at once.
+        
+        The checks of _ROW_CHECKS are evaluated in order and each row reports the first one
+        it fails. Messages that depend on the row are only formatted for the rows that fail.
+        
+        Args:
+            ct_types: Stripped Cointracking transaction types.
+            type_missing: Boolean array flagging rows without a transaction type.
+            transaction_types: Mapped TransactionType values.
+            has_buy: Boolean array flagging rows with a valid buy amount and currency.
+            has_sell: Boolean array flagging rows with a valid sell amount and currency.
+            date_errors: Object array of date parsing error messages.
+            
+        Returns:
+            Object array with the error message for every invalid row and None for valid rows.
+        """
+        import numpy as np
+        import pandas as pd
+        
+        def is_type(values: pd.Series, *types) -> np.ndarray:
+            return values.isin(types).to_numpy()
+        
+        buy_only_types = is_type(ct_types, *self.BUY_ONLY_TYPES)
+        incoming_types = is_type(transaction_types, *self.INCOMING_TYPES)
+        outgoing_types = is_type(transaction_types, *self.OUTGOING_TYPES)
+        
+        # The checks of _ROW_CHECKS, in the same order
+        failed_checks = [
+            type_missing,
+            ~(has_buy | has_sell),
+            is_type(ct_types, "Buy") & ~has_buy,
+            is_type(ct_types, "Sell") & ~has_sell,
+            is_type(ct_types, "Trade") & ~(has_buy & has_sell),
+            buy_only_types & ~has_buy,
+            is_type(ct_types, "Withdrawal") & ~has_sell,
+            pd.notna(date_errors),
+            incoming_types & ~has_buy,
+            outgoing_types & ~has_sell,
+            is_type(transaction_types, TransactionType.TRADE) & ~(has_buy & has_sell),
+        ]
+        
+        errors = np.full(len(ct_types), None, dtype=object)
+        pending = np.ones(len(ct_types), dtype=bool)
+        for message, failed in zip(_ROW_CHECKS, failed_checks, strict=True):
+            mask = pending & failed
+            if mask.any():
+                errors[mask] = message if "{" not in message else [
+                    _format_row_error(message, ct_types.iat[i], transaction_types.iat[i], date_errors[i])
+                    for i in np.flatnonzero(mask)
+                ]
+                pending &= ~mask
+        return errors
+
+    @staticmethod
+    def _column_values(values: pd.Series) -> List[Optional[str]]:
+        """
+        Convert a column to a list with None for missing values.
+        
+        Args:
+            values: Column to convert.
+            
+        Returns:
+            List of the column values.
+        """
+        return values.astype(object).where(values.notna(), None).tolist()
+
+    def _detect_date_format(self, dates: Iterable[Optional[str]]) -> Optional[str]:
+        """
+        Detect the date format of a file from its first non-empty date.
+        
+        The detected format is tried first by _try_parse_date; the remaining formats
+        are still tried for rows that do not match it.
+        
+        Args:
+            dates: Stripped date values of the file, missing values included.
+            
+        Returns:
+            The detected format, or None if the first date matches no format.
+        """
+        self._date_formats = self.DATE_FORMATS
+        
+        sample = next((date for date in dates if isinstance(date, str) and date), None)
+        if sample is None:
+            return None
         
-        # Try each format in order
         for fmt in self.DATE_FORMATS:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError as e:
-                # In Python 3.11, ValueError has better error messages
-                format_errors.append(f"Format {fmt}: {str(e)}")
-                continue
+            if _match_date(sample, fmt) is not None:
+                self._date_formats = (fmt,) + tuple(f for f in self.DATE_FORMATS if f != fmt)
+                return fmt
         
-        # If we get here, none of the formats worked
-        error_msg = "Could not parse date string. Tried the following formats:\n"
-        error_msg += "\n".join(format_errors)
-        raise DataValidationException(f"Invalid date format '{date_str}': {error_msg}")
+        return None
 
-    def _parse_decimal(self, value: str, field_name: str) -> Decimal:
+    def _try_parse_date(self, date_str: str) -> Tuple[Optional[datetime], Optional[str]]:
         """
-        Parse a string value into a Decimal, with validation.
+        Parse a date string into a datetime object, returning the error instead of raising it.
         
         Args:
-            value: String value to parse.
-            field_name: Name of the field for error reporting.
+            date_str: Date string to parse.
             
         Returns:
-            Decimal value.
+            Tuple with the parsed datetime (None if invalid) and the error message (None if valid).
+        """
+        if not date_str or not isinstance(date_str, str):
+            return None, f"Invalid date string: {date_str}"
+        
+        # Strip whitespace
+        return self._parse_date_cached(date_str.strip(), self._date_formats)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=65536)
+    def _parse_date_cached(date_str: str, formats: Tuple[str, ...]) -> Tuple[Optional[datetime], Optional[str]]:
+        """
+        Parse a stripped date string, trying each format in order.
+        
+        Results are memoized on the exact string, since exports often repeat timestamps.
+        Errors are returned rather than raised so that invalid dates are memoized too.
+        
+        Args:
+            date_str: Stripped date string to parse.
+            formats: Date formats to try.
             
-        Raises:
-            DataValidationException: If the value cannot be parsed as a Decimal.
+        Returns:
+            Tuple with the parsed datetime (None if invalid) and the error message (None if valid).
         """
-        try:
-            # Replace comma with dot for decimal separator
-            if isinstance(value, str):
-                value = value.replace(',', '.')
-                
-                # Remove whitespace
-                value = value.strip()
-                
-                # Handle European number formats with space as thousand separator
-                value = value.replace(' ', '')
-            
-            decimal_value = Decimal(str(value))
-            if decimal_value < 0:
-                raise DataValidationException(f"{field_name} cannot be negative: {value}")
-            return decimal_value
-        except InvalidOperation:
-            raise DataValidationException(f"Invalid {field_name} value: {value}")
\ No newline at end of file
+        for fmt in formats:
+            parsed = _match_date(date_str, fmt)
+            if parsed is not None:
+                return parsed, None
+        
+        # If we get here, none of the formats worked; only now collect the per-format errors
+        format_errors = []
+        for fmt in formats:
+            try:
+                datetime.strptime(date_str, fmt)
+            except ValueError as e:
+                # In Python 3.11, ValueError has better error messages
+                format_errors.append(f"Format {fmt}: {str(e)}")
+        
+        error_msg = "Could not parse date string. Tried the following formats:\n"
+        error_msg += "\n".join(format_errors)
+        return None, f"Invalid date format '{date_str}': {error_msg}"
@@ -5,6 +5,7 @@ from qntropy.models.transaction import (
     TransactionType,
     Asset,
     AssetAmount,
+    ImportResult,
 )
 
-__all__ = ["Transaction", "TransactionType", "Asset", "AssetAmount"]
+__all__ = ["Transaction", "TransactionType", "Asset", "AssetAmount", "ImportResult"]
@@ -1,11 +1,13 @@
 """Data models for representing cryptocurrency transactions."""
 
+import functools
+from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum, auto
-from typing import Optional, Union
+from typing import Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class TransactionType(str, Enum):
@@ -41,6 +43,9 @@ class TransactionType(str, Enum):
 class Asset(BaseModel):
     """Model representing a cryptocurrency asset."""
 
+    # Immutable so a single instance can be shared by every amount of the same asset
+    model_config = ConfigDict(frozen=True)
+
     symbol: str = Field(..., description="Asset symbol (e.g., BTC, ETH)")
     name: Optional[str] = Field(None, description="Full name of the asset")
 
@@ -48,17 +53,39 @@ class Asset(BaseModel):
         """Return string representation of the asset."""
         return self.symbol
 
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def get(cls, symbol: str, name: Optional[str] = None) -> "Asset":
+        """
+        Return the shared Asset for a symbol.
+        
+        Histories only reference a few dozen distinct assets, so callers building many
+        amounts can share one (frozen) instance per asset instead of a new model each time.
+        
+        Args:
+            symbol: Asset symbol.
+            name: Full name of the asset.
+            
+        Returns:
+            Asset instance.
+        """
+        return cls(symbol=symbol, name=name)
+
 
 class AssetAmount(BaseModel):
     """Model representing an amount of a specific asset."""
 
+    model_config = ConfigDict(frozen=True)
+
     asset: Asset
     amount: Decimal = Field(..., description="Amount of the asset")
 
     def __str__(self) -> str:
         """Return string representation of the asset amount."""
         # Format decimal to avoid scientific notation
-        formatted_amount = format(self.amount, 'f').rstrip('0').rstrip('.') if '.' in format(self.amount, 'f') else format(self.amount, 'f')
+        formatted_amount = format(self.amount, 'f')
+        if '.' in formatted_amount:
+            formatted_amount = formatted_amount.rstrip('0').rstrip('.')
         return f"{formatted_amount} {self.asset}"
 
     @field_validator('amount')
@@ -114,11 +141,50 @@ class Transaction(BaseModel):
 
     def __str__(self) -> str:
         """Return string representation of the transaction."""
-        if self.transaction_type in [TransactionType.BUY, TransactionType.DEPOSIT, TransactionType.STAKING_REWARD]:
-            return f"{self.transaction_type.value}: {self.asset_in}"
-        elif self.transaction_type in [TransactionType.SELL, TransactionType.WITHDRAWAL]:
-            return f"{self.transaction_type.value}: {self.asset_out}"
-        elif self.transaction_type == TransactionType.TRADE:
-            return f"Trade: {self.asset_out} -> {self.asset_in}"
-        else:
+        formatter = _TRANSACTION_FORMATTERS.get(self.transaction_type)
+        if formatter is None:
             return f"{self.transaction_type.value} at {self.timestamp}"
+        return formatter(self)
+
+
+def _format_incoming(transaction: Transaction) -> str:
+    return f"{transaction.transaction_type.value}: {transaction.asset_in}"
+
+
+def _format_outgoing(transaction: Transaction) -> str:
+    return f"{transaction.transaction_type.value}: {transaction.asset_out}"
+
+
+def _format_trade(transaction: Transaction) -> str:
+    return f"Trade: {transaction.asset_out} -> {transaction.asset_in}"
+
+
+# String representation by transaction type; other types show their timestamp
+_TRANSACTION_FORMATTERS = {
+    TransactionType.BUY: _format_incoming,
+    TransactionType.DEPOSIT: _format_incoming,
+    TransactionType.STAKING_REWARD: _format_incoming,
+    TransactionType.SELL: _format_outgoing,
+    TransactionType.WITHDRAWAL: _format_outgoing,
+    TransactionType.TRADE: _format_trade,
+}
+
+
+class ImportResult(List[Transaction]):
+    """List of imported transactions, with lookups by transaction type."""
+
+    @functools.cached_property
+    def by_type(self) -> Dict[TransactionType, List[Transaction]]:
+        """
+        Group the transactions by type, keeping their order.
+        
+        The grouping is computed on first access, so it does not reflect later
+        changes to the list.
+        
+        Returns:
+            Dictionary mapping each transaction type present to its transactions.
+        """
+        groups: Dict[TransactionType, List[Transaction]] = defaultdict(list)
+        for transaction in self:
+            groups[transaction.transaction_type].append(transaction)
+        return dict(groups)
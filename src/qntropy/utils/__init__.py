@@ -6,7 +6,7 @@ from qntropy.utils.exceptions import (
     CSVFormatException,
     DataValidationException,
 )
-from qntropy.utils.serializers import TransactionEncoder
+from qntropy.utils.serializers import TransactionEncoder, dumps, json_default
 
 __all__ = [
     "QntropyBaseException",
@@ -14,4 +14,6 @@ __all__ = [
     "CSVFormatException", 
     "DataValidationException",
     "TransactionEncoder",
+    "dumps",
+    "json_default",
 ]
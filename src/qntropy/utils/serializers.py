@@ -4,6 +4,9 @@ import json
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from typing import Any
+
+import orjson
 
 
 class TransactionEncoder(json.JSONEncoder):
@@ -18,3 +21,28 @@ class TransactionEncoder(json.JSONEncoder):
         if isinstance(obj, Enum):
             return obj.value
         return super().default(obj)
+
+
+def json_default(obj: Any) -> str:
+    """Convert objects that orjson does not serialize natively (datetimes and enums it handles itself)."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to JSON with orjson.
+    
+    Converts values like TransactionEncoder: Decimals become strings, datetimes
+    ISO 8601 strings and enums their values. Unlike json.dump, non-ASCII
+    characters are written as UTF-8 rather than as \\u escapes.
+    
+    Args:
+        obj: Object to serialize.
+        indent: Whether to indent the output with two spaces.
+        
+    Returns:
+        The UTF-8 encoded JSON document.
+    """
+    return orjson.dumps(obj, default=json_default, option=orjson.OPT_INDENT_2 if indent else 0)
@@ -11,7 +11,7 @@ from qntropy.importers.cointracking import CointrackingImporter
 from qntropy.models.transaction import TransactionType
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_csv_path():
     """Return the path to the sample CSV fixture."""
     return Path(__file__).parent.parent / "fixtures" / "cointracking_sample.csv"
@@ -43,7 +43,7 @@ class TestCointrackingIntegration:
         assert TransactionType.TRANSFER in transaction_types
         
         # Verify some specific transactions
-        buy_tx = next(tx for tx in transactions if tx.transaction_type == TransactionType.BUY)
+        buy_tx = transactions.by_type[TransactionType.BUY][0]
         assert buy_tx.asset_in.asset.symbol == "ETH"
         assert buy_tx.asset_in.amount == Decimal("1")
         assert buy_tx.asset_out.asset.symbol == "EUR"
@@ -52,7 +52,7 @@ class TestCointrackingIntegration:
         assert buy_tx.fee.amount == Decimal("2.5")
         assert buy_tx.exchange == "Coinbase"
         
-        staking_tx = next(tx for tx in transactions if tx.transaction_type == TransactionType.STAKING_REWARD)
+        staking_tx = transactions.by_type[TransactionType.STAKING_REWARD][0]
         assert staking_tx.asset_in.asset.symbol == "DOT"
         assert staking_tx.asset_in.amount == Decimal("10")
         assert staking_tx.fee.asset.symbol == "DOT"
@@ -68,10 +68,10 @@ class TestCointrackingIntegration:
         output_path = tmp_path / "transactions.json"
         
         # Run the import command
-        imported_transactions = import_cointracking(sample_csv_path, output_path)
+        imported_count = import_cointracking(sample_csv_path, output_path)
         
-        # Check that the transactions were returned
-        assert len(imported_transactions) == 7
+        # Check that the number of imported transactions was returned
+        assert imported_count == 7
         
         # Check that the JSON file was created
         assert output_path.exists()
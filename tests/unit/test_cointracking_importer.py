@@ -1,15 +1,15 @@
 """Unit tests for the Cointracking importer."""
 
+from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
 
-import pandas as pd
 import pytest
-from pandas.testing import assert_frame_equal
 
+from qntropy.importers import cointracking
 from qntropy.importers.cointracking import CointrackingImporter
 from qntropy.models.transaction import Asset, TransactionType
-from qntropy.utils.exceptions import CSVFormatException, DataValidationException
+from qntropy.utils.exceptions import CSVFormatException
 
 
 class TestCointrackingImporter:
@@ -43,6 +43,9 @@ Deposit,1000,EUR,,,,,Binance,Funding,Initial deposit,2023-01-10 09:15:00
         assert trade_tx.fee.amount == Decimal("5")
         assert trade_tx.exchange == "Binance"
         
+        # Rows referencing the same symbol share one Asset instance
+        assert trade_tx.fee.asset is trade_tx.asset_out.asset
+        
         # Check the deposit transaction
         deposit_tx = transactions[1]
         assert deposit_tx.transaction_type == TransactionType.DEPOSIT
@@ -53,6 +56,91 @@ Deposit,1000,EUR,,,,,Binance,Funding,Initial deposit,2023-01-10 09:15:00
         assert deposit_tx.exchange == "Binance"
         assert deposit_tx.notes == "Initial deposit"
 
+    def test_import_file_columnar(self, tmp_path, monkeypatch):
+        """Test that the column-wise path for large files matches the row-by-row path."""
+        csv_content = """Type,Buy Amount,Buy Currency,Sell Amount,Sell Currency,Fee,Fee Currency,Exchange,Group,Comment,Date
+Trade,0.5,BTC,7500,EUR,5,EUR,Binance,Trading,,2023-01-15 14:30:25
+Deposit, 1000 ,EUR,,,,,Binance,Funding,Initial deposit,15.01.2023 09:15
+Withdrawal,,,"0,25",BTC,,,Kraken,,,2023-01-16 10:00:00
+Mystery,1,ETH,,,,,Kraken,,,2023-01-17 10:00:00
+Deposit,-1,EUR,,,,,Binance,,,2023-01-18 10:00:00
+Deposit,2,ETH,,,1,None,Kraken,None,<NA>,2023-01-19 10:00:00
+"""
+        csv_file = tmp_path / "test_columnar.csv"
+        csv_file.write_text(csv_content)
+        
+        expected = CointrackingImporter(skip_invalid_rows=True).import_file(csv_file)
+        monkeypatch.setattr(CointrackingImporter, "SMALL_FILE_SIZE", 0)
+        transactions = CointrackingImporter(skip_invalid_rows=True).import_file(csv_file)
+        
+        assert len(transactions) == 5
+        assert [tx.model_dump() for tx in transactions] == [tx.model_dump() for tx in expected]
+        
+        # "None" and "<NA>" are missing values on every path
+        assert transactions[4].fee is None
+        assert transactions[4].trade_group is None
+        assert transactions[4].notes is None
+
+    def test_import_file_without_pandas(self, tmp_path, monkeypatch):
+        """Test that files of any size are imported row by row when pandas is not installed."""
+        csv_content = """Type,Buy Amount,Buy Currency,Sell Amount,Sell Currency,Fee,Fee Currency,Exchange,Group,Comment,Date
+Trade,0.5,BTC,7500,EUR,5,EUR,Binance,Trading,,2023-01-15 14:30:25
+Deposit,1000,EUR,,,,,Binance,Funding,Initial deposit,2023-01-10 09:15:00
+"""
+        csv_file = tmp_path / "test_without_pandas.csv"
+        csv_file.write_text(csv_content)
+        
+        monkeypatch.setattr(CointrackingImporter, "SMALL_FILE_SIZE", 0)
+        monkeypatch.setattr(cointracking, "_load_dataframe_libraries", lambda: False)
+        
+        transactions = CointrackingImporter().import_file(csv_file)
+        
+        assert [tx.transaction_type for tx in transactions] == [TransactionType.TRADE, TransactionType.DEPOSIT]
+
+    def test_import_file_columnar_short_row(self, tmp_path, monkeypatch):
+        """Test that a row with fewer fields than the header is reported like on the row-by-row path."""
+        rows = [f"Deposit,{i + 1},BTC,,,,,Binance,,,2023-01-15 14:30:25\n" for i in range(30)]
+        rows[20] = "Deposit,21,BTC,,,,,Binance\n"
+        rows[5] = "\n" + rows[5]  # A blank line, which neither reader counts as a row
+        csv_file = tmp_path / "test_short_row.csv"
+        csv_file.write_text(
+            "Type,Buy Amount,Buy Currency,Sell Amount,Sell Currency,Fee,Fee Currency,Exchange,Group,Comment,Date\n"
+            + "".join(rows)
+        )
+        
+        expected = CointrackingImporter(skip_invalid_rows=True).import_file(csv_file)
+        
+        # Read the large-file way, with the short row in a later block
+        monkeypatch.setattr(CointrackingImporter, "CHUNK_SIZE", 10)
+        monkeypatch.setattr(CointrackingImporter, "ARROW_BLOCK_SIZE", 256)
+        monkeypatch.setattr(CointrackingImporter, "SMALL_FILE_SIZE", 0)
+        transactions = CointrackingImporter(skip_invalid_rows=True).import_file(csv_file)
+        
+        assert len(transactions) == 29
+        assert 22 not in [tx.source_line for tx in transactions]
+        assert [tx.model_dump() for tx in transactions] == [tx.model_dump() for tx in expected]
+
+    def test_import_file_columnar_multiline_comment(self, tmp_path, monkeypatch):
+        """Test that quoted line breaks across a block boundary are read like on the row-by-row path."""
+        rows = [f'Deposit,{i + 1},BTC,,,,,Binance,,"note {i + 1}\nsecond line",2023-01-15 14:30:25\n' for i in range(30)]
+        csv_file = tmp_path / "test_multiline_comment.csv"
+        csv_file.write_text(
+            "Type,Buy Amount,Buy Currency,Sell Amount,Sell Currency,Fee,Fee Currency,Exchange,Group,Comment,Date\n"
+            + "".join(rows)
+        )
+        
+        expected = CointrackingImporter().import_file(csv_file)
+        
+        # Blocks of 256 bytes end inside some of the quoted comments
+        monkeypatch.setattr(CointrackingImporter, "CHUNK_SIZE", 10)
+        monkeypatch.setattr(CointrackingImporter, "ARROW_BLOCK_SIZE", 256)
+        monkeypatch.setattr(CointrackingImporter, "SMALL_FILE_SIZE", 0)
+        transactions = CointrackingImporter().import_file(csv_file)
+        
+        assert len(transactions) == 30
+        assert transactions[29].notes == "note 30\nsecond line"
+        assert [tx.model_dump() for tx in transactions] == [tx.model_dump() for tx in expected]
+
     def test_import_file_missing_columns(self, tmp_path):
         """Test import with missing columns."""
         # Create a test CSV file with missing columns
@@ -114,21 +202,39 @@ Trade,not-a-number,BTC,7500,EUR,5,EUR,Binance,Trading,,2023-01-15 14:30:25
         # Check the error message
         assert "is empty" in str(excinfo.value)
 
-    def test_parse_decimal(self):
-        """Test decimal parsing with various formats."""
-        importer = CointrackingImporter()
+    def test_parse_amount(self):
+        """Test amount parsing with various formats."""
+        # Test valid amounts
+        assert CointrackingImporter._parse_amount("123.45") == Decimal("123.45")
+        assert CointrackingImporter._parse_amount("123,45") == Decimal("123.45")
         
-        # Test valid decimal values
-        assert importer._parse_decimal("123.45", "Test") == Decimal("123.45")
-        assert importer._parse_decimal("123,45", "Test") == Decimal("123.45")
-        assert importer._parse_decimal("0", "Test") == Decimal("0")
-        
-        # Test invalid decimal values
-        with pytest.raises(DataValidationException):
-            importer._parse_decimal("-1", "Test")  # Negative values not allowed
-            
-        with pytest.raises(DataValidationException):
-            importer._parse_decimal("not-a-number", "Test")
+        # Test invalid amounts, which the importer treats as no amount
+        assert CointrackingImporter._parse_amount("0") is None  # Amounts must be positive
+        assert CointrackingImporter._parse_amount("-1") is None
+        assert CointrackingImporter._parse_amount("not-a-number") is None
+        assert CointrackingImporter._parse_amount(None) is None
+
+    def test_parse_date(self):
+        """Test date parsing with the supported formats."""
+        importer = CointrackingImporter()
+        expected = datetime(2023, 1, 15, 14, 30, 25)
+
+        # Test valid date strings
+        assert importer._try_parse_date("2023-01-15 14:30:25") == (expected, None)
+        assert importer._try_parse_date(" 2023-01-15 14:30:25 ") == (expected, None)
+        assert importer._try_parse_date("2023-01-15T14:30:25") == (expected, None)
+        assert importer._try_parse_date("15/01/2023 14:30:25") == (expected, None)
+        assert importer._try_parse_date("15-01-2023 14:30:25") == (expected, None)
+        assert importer._try_parse_date("15.01.2023 14:30") == (datetime(2023, 1, 15, 14, 30), None)
+
+        # Repeated strings return the same result
+        assert importer._try_parse_date("2023-01-15 14:30:25") == (expected, None)
+
+        # Test invalid date strings
+        for date_str in ("not-a-date", "", "2023-02-30 14:30:25"):  # The last has no such day
+            timestamp, error = importer._try_parse_date(date_str)
+            assert timestamp is None
+            assert error.startswith("Invalid date")
 
     def test_transaction_type_mapping(self):
         """Test mapping of Cointracking transaction types to internal types."""
@@ -9,6 +9,7 @@ from pydantic import ValidationError
 from qntropy.models.transaction import (
     Asset,
     AssetAmount,
+    ImportResult,
     Transaction,
     TransactionType,
 )
@@ -32,6 +33,21 @@ class TestAsset:
         asset = Asset(symbol="ETH", name="Ethereum")
         assert str(asset) == "ETH"
 
+    def test_asset_is_immutable(self):
+        """Test that an Asset cannot be modified, so instances can be shared."""
+        asset = Asset(symbol="BTC")
+        with pytest.raises(ValidationError):
+            asset.symbol = "ETH"
+        assert asset == Asset(symbol="BTC")
+        assert hash(asset) == hash(Asset(symbol="BTC"))
+
+    def test_asset_get_is_shared(self):
+        """Test that Asset.get returns one shared instance per asset."""
+        asset = Asset.get("BTC")
+        assert asset == Asset(symbol="BTC")
+        assert Asset.get("BTC") is asset
+        assert Asset.get("BTC", "Bitcoin").name == "Bitcoin"
+
 
 class TestAssetAmount:
     """Tests for the AssetAmount model."""
@@ -42,6 +58,9 @@ class TestAssetAmount:
         asset_amount = AssetAmount(asset=asset, amount=Decimal("1.5"))
         assert asset_amount.asset.symbol == "BTC"
         assert asset_amount.amount == Decimal("1.5")
+        
+        with pytest.raises(ValidationError):
+            asset_amount.amount = Decimal("2")
 
     def test_asset_amount_string_representation(self):
         """Test the string representation of an AssetAmount."""
@@ -112,97 +131,87 @@ class TestAssetAmount:
 class TestTransaction:
     """Tests for the Transaction model."""
 
-    def test_buy_transaction_creation(self):
-        """Test creating a Buy transaction."""
+    @staticmethod
+    def _amount(spec):
+        """Build an AssetAmount from a (symbol, amount) pair, or None."""
+        if spec is None:
+            return None
+        symbol, amount = spec
+        return AssetAmount(asset=Asset.get(symbol), amount=Decimal(amount))
+
+    @pytest.mark.parametrize(
+        "transaction_type, asset_in, asset_out, fee, metadata",
+        [
+            (
+                TransactionType.BUY, ("BTC", "1"), ("EUR", "20000"), ("EUR", "10"),
+                {"exchange": "Coinbase", "trade_group": "Investment", "notes": "Test buy transaction"},
+            ),
+            (
+                TransactionType.SELL, ("EUR", "21000"), ("BTC", "1"), ("EUR", "10.5"),
+                {"exchange": "Binance"},
+            ),
+            (
+                TransactionType.DEPOSIT, ("EUR", "5000"), None, None,
+                {"exchange": "Kraken"},
+            ),
+        ],
+        ids=["buy", "sell", "deposit"],
+    )
+    def test_transaction_creation(self, transaction_type, asset_in, asset_out, fee, metadata):
+        """Test creating transactions of the common types."""
         timestamp = datetime(2023, 1, 1, 12, 0, 0)
-        asset_in = AssetAmount(asset=Asset(symbol="BTC"), amount=Decimal("1"))
-        asset_out = AssetAmount(asset=Asset(symbol="EUR"), amount=Decimal("20000"))
-        fee = AssetAmount(asset=Asset(symbol="EUR"), amount=Decimal("10"))
         
         transaction = Transaction(
             timestamp=timestamp,
-            transaction_type=TransactionType.BUY,
-            asset_in=asset_in,
-            asset_out=asset_out,
-            fee=fee,
-            exchange="Coinbase",
-            trade_group="Investment",
-            notes="Test buy transaction",
+            transaction_type=transaction_type,
+            asset_in=self._amount(asset_in),
+            asset_out=self._amount(asset_out),
+            fee=self._amount(fee),
+            **metadata,
         )
         
         assert transaction.timestamp == timestamp
-        assert transaction.transaction_type == TransactionType.BUY
-        assert transaction.asset_in == asset_in
-        assert transaction.asset_out == asset_out
-        assert transaction.fee == fee
-        assert transaction.exchange == "Coinbase"
-        assert transaction.trade_group == "Investment"
-        assert transaction.notes == "Test buy transaction"
+        assert transaction.transaction_type == transaction_type
+        assert transaction.asset_in == self._amount(asset_in)
+        assert transaction.asset_out == self._amount(asset_out)
+        assert transaction.fee == self._amount(fee)
+        for field, value in metadata.items():
+            assert getattr(transaction, field) == value
         assert transaction.is_synthetic is False
 
-    def test_sell_transaction_creation(self):
-        """Test creating a Sell transaction."""
-        timestamp = datetime(2023, 1, 2, 12, 0, 0)
-        asset_in = AssetAmount(asset=Asset(symbol="EUR"), amount=Decimal("21000"))
-        asset_out = AssetAmount(asset=Asset(symbol="BTC"), amount=Decimal("1"))
-        fee = AssetAmount(asset=Asset(symbol="EUR"), amount=Decimal("10.5"))
-        
+    @pytest.mark.parametrize(
+        "transaction_type, asset_in, asset_out, expected_prefix",
+        [
+            (TransactionType.BUY, ("BTC", "1"), None, "Buy:"),
+            (TransactionType.SELL, None, ("BTC", "1"), "Sell:"),
+            (TransactionType.TRADE, ("ETH", "10"), ("BTC", "0.5"), "Trade:"),
+        ],
+        ids=["buy", "sell", "trade"],
+    )
+    def test_transaction_string_representation(self, transaction_type, asset_in, asset_out, expected_prefix):
+        """Test the string representation of various Transaction types."""
         transaction = Transaction(
-            timestamp=timestamp,
-            transaction_type=TransactionType.SELL,
-            asset_in=asset_in,
-            asset_out=asset_out,
-            fee=fee,
-            exchange="Binance",
+            timestamp=datetime(2023, 1, 1, 12, 0, 0),
+            transaction_type=transaction_type,
+            asset_in=self._amount(asset_in),
+            asset_out=self._amount(asset_out),
         )
-        
-        assert transaction.timestamp == timestamp
-        assert transaction.transaction_type == TransactionType.SELL
-        assert transaction.asset_in == asset_in
-        assert transaction.asset_out == asset_out
-        assert transaction.fee == fee
-        assert transaction.exchange == "Binance"
+        assert str(transaction).startswith(expected_prefix)
 
-    def test_deposit_transaction_creation(self):
-        """Test creating a Deposit transaction."""
-        timestamp = datetime(2023, 1, 3, 12, 0, 0)
-        asset_in = AssetAmount(asset=Asset(symbol="EUR"), amount=Decimal("5000"))
-        
-        transaction = Transaction(
-            timestamp=timestamp,
-            transaction_type=TransactionType.DEPOSIT,
-            asset_in=asset_in,
-            exchange="Kraken",
-        )
-        
-        assert transaction.timestamp == timestamp
-        assert transaction.transaction_type == TransactionType.DEPOSIT
-        assert transaction.asset_in == asset_in
-        assert transaction.exchange == "Kraken"
 
-    def test_transaction_string_representation(self):
-        """Test the string representation of various Transaction types."""
-        # Buy transaction
-        buy_tx = Transaction(
-            timestamp=datetime(2023, 1, 1, 12, 0, 0),
-            transaction_type=TransactionType.BUY,
-            asset_in=AssetAmount(asset=Asset(symbol="BTC"), amount=Decimal("1")),
-        )
-        assert str(buy_tx).startswith("Buy:")
+class TestImportResult:
+    """Tests for the ImportResult list."""
+
+    def test_by_type(self):
+        """Test grouping imported transactions by type."""
+        btc = AssetAmount(asset=Asset(symbol="BTC"), amount=Decimal("1"))
+        deposit = Transaction(timestamp=datetime(2023, 1, 1), transaction_type=TransactionType.DEPOSIT, asset_in=btc)
+        withdrawal = Transaction(timestamp=datetime(2023, 1, 2), transaction_type=TransactionType.WITHDRAWAL, asset_out=btc)
+        second_deposit = Transaction(timestamp=datetime(2023, 1, 3), transaction_type=TransactionType.DEPOSIT, asset_in=btc)
         
-        # Sell transaction
-        sell_tx = Transaction(
-            timestamp=datetime(2023, 1, 2, 12, 0, 0),
-            transaction_type=TransactionType.SELL,
-            asset_out=AssetAmount(asset=Asset(symbol="BTC"), amount=Decimal("1")),
-        )
-        assert str(sell_tx).startswith("Sell:")
-        
-        # Trade transaction
-        trade_tx = Transaction(
-            timestamp=datetime(2023, 1, 3, 12, 0, 0),
-            transaction_type=TransactionType.TRADE,
-            asset_in=AssetAmount(asset=Asset(symbol="ETH"), amount=Decimal("10")),
-            asset_out=AssetAmount(asset=Asset(symbol="BTC"), amount=Decimal("0.5")),
-        )
-        assert "Trade:" in str(trade_tx)
\ No newline at end of file
+        transactions = ImportResult([deposit, withdrawal, second_deposit])
+        
+        assert transactions == [deposit, withdrawal, second_deposit]
+        assert transactions.by_type[TransactionType.DEPOSIT] == [deposit, second_deposit]
+        assert transactions.by_type[TransactionType.WITHDRAWAL] == [withdrawal]
+        assert TransactionType.TRADE not in transactions.by_type